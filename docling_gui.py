@@ -1,197 +1,571 @@
 import sys
 import os
+import io
+import mmap
+import hashlib
 import platform
-import time # For simulating load if needed
-import traceback # For detailed error reporting
+import logging # For error reporting with tracebacks
+from pathlib import PurePath # For suffix/stem handling without manual string ops
 import threading # Used for threads
-
-# --- FIX for Hugging Face Hub Symlink Error on Windows ---
-if platform.system() == 'Windows':
-    print("Applying Windows Hugging Face Hub symlink workaround...")
-    os.environ['HF_HUB_DISABLE_SYMLINKS'] = '1'
-    os.environ['HF_HUB_DISABLE_SYMLINKS_WARNING'] = '1'
+import importlib.util # For memoized imports and optional-package probes
+
+logger = logging.getLogger(__name__)
+
+# --- Platform probes (cached once; platform.system() is not free) ---
+_PLATFORM = platform.system()
+IS_WINDOWS = _PLATFORM == 'Windows'
+IS_MACOS = _PLATFORM == 'Darwin'
+
+# --- Hugging Face Hub symlink tuning (and Windows error fix) ---
+# Symlink bookkeeping is a per-file cost during model downloads, and on
+# Windows it outright fails without developer mode (WinError 1314). Disable
+# it everywhere and raise the auto-symlink threshold so small model files are
+# stored directly. setdefault keeps any user-provided environment in charge.
+os.environ.setdefault('HF_HUB_DISABLE_SYMLINKS', '1')
+os.environ.setdefault('HF_HUB_LOCAL_DIR_AUTO_SYMLINK_THRESHOLD', str(100 * 1024 * 1024))
+# hf_transfer (a Rust downloader) parallelizes the first-run model download.
+# Only opt in when the package is actually installed: huggingface_hub raises
+# an error if the flag is set without it.
+if importlib.util.find_spec('hf_transfer') is not None:
+    os.environ.setdefault('HF_HUB_ENABLE_HF_TRANSFER', '1')
+if IS_WINDOWS:
+    logger.debug("Applying Windows Hugging Face Hub symlink workaround...")
+    os.environ.setdefault('HF_HUB_DISABLE_SYMLINKS_WARNING', '1')
 # --- End Fix ---
 
 # --- GUI Imports (Place after potential env var changes) ---
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QFileDialog, QTextEdit, QLabel, QMessageBox, QSizePolicy,
-    QProgressDialog, QProgressBar, QSpacerItem # Added QSpacerItem
+    QPushButton, QFileDialog, QPlainTextEdit, QLabel, QMessageBox, QSizePolicy,
+    QProgressDialog, QProgressBar, QStackedWidget, QListView
+)
+from PySide6.QtCore import (
+    Qt, Slot, QTimer, QSize, Signal, QObject, QSaveFile, QIODevice,
+    QRunnable, QThreadPool, QStringListModel, QMimeDatabase
 )
-from PySide6.QtCore import Qt, Slot, QUrl, QTimer, QSize, QThread, Signal, QObject
-from PySide6.QtGui import QDragEnterEvent, QDropEvent, QClipboard, QFont, QMovie
-import qdarkstyle # For dark theme
+from PySide6.QtGui import QDragEnterEvent, QDropEvent, QFont, QGuiApplication, QClipboard
+# qdarkstyle is imported lazily in _apply_dark_theme after the window shows
+
+_IMPORT_CACHE = {}
+
+def cached_import(module_name, attr=None):
+    """Imports a module (or one of its attributes) once and memoizes it.
+
+    Re-running initialization (e.g. after a failed first attempt) then costs a
+    dict lookup instead of a trip through the import machinery.
+    """
+    key = (module_name, attr)
+    try:
+        return _IMPORT_CACHE[key]
+    except KeyError:
+        module = importlib.import_module(module_name)
+        value = getattr(module, attr) if attr else module
+        _IMPORT_CACHE[key] = value
+        return value
+
+
+_CACHED_LOGIN = None
+
+def _user_login():
+    """Returns the login name, caching it after the first lookup.
+
+    Prefers the environment (USERNAME on Windows, USER elsewhere) — a dict
+    lookup — over the os.getlogin() syscall, which additionally fails outright
+    when there is no controlling terminal (e.g. launched from a .desktop
+    entry or pythonw).
+    """
+    global _CACHED_LOGIN
+    if _CACHED_LOGIN is None:
+        _CACHED_LOGIN = os.environ.get('USERNAME') or os.environ.get('USER')
+        if not _CACHED_LOGIN:
+            try:
+                _CACHED_LOGIN = os.getlogin()
+            except OSError:
+                _CACHED_LOGIN = 'user'
+    return _CACHED_LOGIN
+
 
 # --- macOS Drag-and-Drop Workaround ---
-if platform.system() == 'Darwin':
+# Importing the PyObjC Foundation bridge is slow; defer it until the first
+# drop that actually needs it. The flag is optimistic on macOS and cleared if
+# the import turns out to be unavailable.
+MACOS_DRAG_DROP_WORKAROUND = IS_MACOS
+_NSURL = None
+
+def _get_nsurl():
+    """Lazily imports and returns Foundation.NSURL (or None if unavailable)."""
+    global _NSURL, MACOS_DRAG_DROP_WORKAROUND
+    if _NSURL is None and MACOS_DRAG_DROP_WORKAROUND:
+        try:
+            from Foundation import NSURL
+            _NSURL = NSURL
+        except ImportError:
+            MACOS_DRAG_DROP_WORKAROUND = False
+    return _NSURL
+
+# --- On-disk conversion cache ---
+# Converted markdown is cached under the user cache directory, keyed by the
+# SHA-256 of the input file's bytes, so re-converting an unchanged document
+# costs a hash + disk read instead of a full docling pipeline run. The cache
+# is best effort throughout: any I/O problem just means a fresh conversion.
+
+def _conversion_cache_dir():
+    """Returns the per-user cache directory for converted markdown."""
+    if IS_WINDOWS:
+        root = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    elif IS_MACOS:
+        root = os.path.expanduser('~/Library/Caches')
+    else:
+        root = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(root, 'documark-transformer')
+
+
+# Files at least this large are hashed through a memory map
+_MMAP_HASH_THRESHOLD = 8 * 1024 * 1024
+
+
+def _hash_file(file_path):
+    """Returns the SHA-256 hex digest of a file's contents (or None on error).
+
+    Always called from a worker thread. Large files are hashed straight out
+    of the page cache via mmap — one pass, no read() copies; smaller ones go
+    through buffered reads where mmap setup would not pay off.
+    """
     try:
-        from Foundation import NSURL
-        MACOS_DRAG_DROP_WORKAROUND = True
-    except ImportError:
-        MACOS_DRAG_DROP_WORKAROUND = False
-else:
-    MACOS_DRAG_DROP_WORKAROUND = False
+        with open(file_path, 'rb') as fh:
+            if os.fstat(fh.fileno()).st_size >= _MMAP_HASH_THRESHOLD:
+                try:
+                    with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        return hashlib.sha256(mapped).hexdigest()
+                except (OSError, ValueError):
+                    pass # mmap can fail on odd filesystems; stream instead
+            if hasattr(hashlib, 'file_digest'):
+                # Python 3.11+: hashes through a reusable buffer entirely in C,
+                # without materializing per-chunk bytes objects
+                return hashlib.file_digest(fh, 'sha256').hexdigest()
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: fh.read(1024 * 1024), b''):
+                digest.update(chunk)
+            return digest.hexdigest()
+    except OSError:
+        return None
+
+
+def _conversion_cache_load(digest):
+    """Returns cached markdown for a digest, or None on miss/error."""
+    try:
+        with open(os.path.join(_conversion_cache_dir(), digest + '.md'),
+                  encoding='utf-8') as fh:
+            return fh.read()
+    except OSError:
+        return None
+
+
+# Soft bound on cached conversions; oldest entries are pruned past this
+_CONVERSION_CACHE_MAX_ENTRIES = 256
+
+
+def _conversion_cache_store(digest, markdown):
+    """Stores converted markdown for a digest (atomically, best effort)."""
+    try:
+        cache_dir = _conversion_cache_dir()
+        os.makedirs(cache_dir, exist_ok=True)
+        final_path = os.path.join(cache_dir, digest + '.md')
+        tmp_path = final_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as fh:
+            fh.write(markdown)
+        os.replace(tmp_path, final_path) # Atomic: readers never see partial files
+        _conversion_cache_prune(cache_dir)
+    except OSError as e:
+        logger.warning("Conversion cache write skipped: %s", e)
+
+
+def _conversion_cache_prune(cache_dir):
+    """Drops the oldest cache entries once the soft entry bound is exceeded."""
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith('.md') and entry.is_file():
+                entries.append((entry.stat().st_mtime, entry.path))
+    if len(entries) <= _CONVERSION_CACHE_MAX_ENTRIES:
+        return
+    entries.sort() # Oldest first
+    for _, path in entries[:len(entries) - _CONVERSION_CACHE_MAX_ENTRIES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass # Another process may have pruned it already
+
 
 # --- Docling Import - Defer this to happen after GUI shows ---
 # Will be imported in InitializationWorker
 
 
 # ==============================================================
-# Worker Thread for Initialization
+# Worker for Initialization (runs on the global QThreadPool)
 # ==============================================================
-class InitializationWorker(QObject):
+class InitializationSignals(QObject):
+    """Signal holder for InitializationWorker (QRunnable cannot own signals)."""
+    initialization_complete = Signal(object, object) # Emits the imported class, shared converter (or None)
+    initialization_error = Signal(str, str)  # Emits error type, message
+
+
+class InitializationWorker(QRunnable):
     """
-    Worker object to perform the slow import in a separate thread.
+    Runnable that performs the slow import on a pooled thread, saving the
+    cost of spinning up (and tearing down) a dedicated QThread for a one-shot
+    job. Signals are emitted directly: cross-thread emission is queued to the
+    receiver's thread by Qt, no event loop is needed on the pool thread.
     """
-    initialization_complete = Signal(object) # Emits the imported class
-    initialization_error = Signal(str, str)  # Emits error type, message
 
-    @Slot()
+    def __init__(self):
+        super().__init__()
+        self.signals = InitializationSignals()
+        # The app holds the reference until the result is handled; don't let
+        # the pool auto-delete the runnable underneath it.
+        self.setAutoDelete(False)
+
     def run(self):
         """Performs the import."""
-        print(f"[InitThread {threading.get_ident()}] Starting initialization...")
+        logger.debug("[InitThread %s] Starting initialization...", threading.get_ident())
         try:
             # --- Actual Import ---
             # Ensure you have langchain-docling installed: pip install langchain-docling
-            from langchain_docling import DoclingLoader as DL_Class
-            print(f"[InitThread {threading.get_ident()}] DoclingLoader imported successfully.")
-            # Use QTimer to ensure signal emission happens from the event loop
-            QTimer.singleShot(0, lambda: self.initialization_complete.emit(DL_Class))
+            DL_Class = cached_import('langchain_docling', 'DoclingLoader')
+            logger.debug("[InitThread %s] DoclingLoader imported successfully.", threading.get_ident())
+
+            # --- Pre-warm the heavy docling machinery (best effort) ---
+            # Importing docling's converter here pulls in torch/transformers and
+            # downloads/locates the models while the user is still looking at the
+            # splash screen, so the first real conversion is a warm start instead
+            # of paying the full cold-start cost.
+            shared_converter = None
+            try:
+                from docling.document_converter import DocumentConverter
+                shared_converter = DocumentConverter()
+                logger.debug("[InitThread %s] Docling converter pre-warmed.", threading.get_ident())
+            except Exception as warm_err:
+                # Pre-warming is purely an optimization; the first conversion
+                # will simply be slower if it fails.
+                logger.warning("[InitThread %s] Pre-warm skipped: %s", threading.get_ident(), warm_err)
+
+            self.signals.initialization_complete.emit(DL_Class, shared_converter)
 
         except ImportError as e:
             error_type = type(e).__name__
             error_message = f"Import Error: {e}"
-            print(f"[InitThread {threading.get_ident()}] {error_message}")
-            QTimer.singleShot(0, lambda: self.initialization_error.emit(error_type, str(e)))
+            logger.warning("[InitThread %s] %s", threading.get_ident(), error_message)
+            self.signals.initialization_error.emit(error_type, str(e))
         except Exception as e:
             error_type = type(e).__name__
-            tb_str = traceback.format_exc()
-            error_message = f"Unexpected Initialization Error: {e}"
-            print(f"[InitThread {threading.get_ident()}] {error_message}\n{tb_str}")
-            QTimer.singleShot(0, lambda: self.initialization_error.emit(error_type, str(e)))
+            # logging.exception captures the traceback without an explicit
+            # format_exc round-trip through a string first
+            logger.exception(f"[InitThread {threading.get_ident()}] Unexpected Initialization Error: {e}")
+            self.signals.initialization_error.emit(error_type, str(e))
         finally:
-            print(f"[InitThread {threading.get_ident()}] Initialization run method finished.")
-        # No explicit cleanup here, thread `finished` signal handles calling deleteLater
+            logger.debug("[InitThread %s] Initialization run method finished.", threading.get_ident())
 
 
 # ==============================================================
-# Worker Thread for Conversion
+# Worker for Conversion (runs on the conversion QThreadPool)
 # ==============================================================
-class ConversionWorker(QObject):
+# Progress stages reported by ConversionWorker. The wire format is a cheap
+# int + path; the GUI side owns the user-facing strings.
+STAGE_INITIALIZING = 0
+STAGE_CONVERTING = 1
+
+
+class ConversionSignals(QObject):
+    """Signal holder for ConversionWorker (QRunnable cannot own signals)."""
+    # Emits the assembled markdown + original file path. None means the loader
+    # returned no documents; "" means documents without content. Sending the
+    # final string instead of the doc list lets the worker free the (large)
+    # intermediate documents before the signal is even delivered.
+    conversion_complete = Signal(object, str)
+    conversion_error = Signal(str, str, str) # Emits error type, message, original file path
+    progress_update = Signal(int, str) # Emits stage code, original file path
+    conversion_chunk = Signal(str, str) # Emits one document's content, original file path
+
+
+class ConversionWorker(QRunnable):
     """
-    Worker object to perform the document conversion in a separate thread.
+    Runnable that performs one document conversion on a pooled thread.
     """
-    conversion_complete = Signal(list, str) # Emits list of docs, original file path
-    conversion_error = Signal(str, str, str) # Emits error type, message, original file path
-    progress_update = Signal(str) # Reports progress stages
 
-    def __init__(self, loader_class, file_path, parent=None):
-        super().__init__(parent)
+    def __init__(self, loader_class, file_path, converter=None):
+        super().__init__()
+        self.signals = ConversionSignals()
+        # The app keeps the worker in active_workers until its batch finishes;
+        # don't let the pool auto-delete the runnable underneath it.
+        self.setAutoDelete(False)
         self.DoclingLoaderClass = loader_class
         self.file_path = file_path
-        self._is_running = True # Flag to signal cancellation
+        self.converter = converter # Shared DocumentConverter (models stay loaded)
+        # Pre-compute the basename once; handlers and progress labels reuse it
+        self.base_name = os.path.basename(file_path)
+        # Event-based cancel token: checked in the worker, set from the GUI
+        # thread without data races, and ready to be waited on if a stage ever
+        # becomes interruptible.
+        self._cancel_event = threading.Event()
 
-    @Slot()
     def run(self):
         """Performs the conversion."""
         thread_id = threading.get_ident()
-        print(f"[ConvThread {thread_id}] Run method started.")
+        logger.debug("[ConvThread %s] Run method started.", thread_id)
 
-        # --- Helper function to emit signals safely via QTimer ---
-        def emit_signal(signal, *args):
-            # Ensure signals are emitted from the thread's event loop context
-            QTimer.singleShot(0, lambda: signal.emit(*args))
+        # Signals are emitted directly: emission from a worker thread to a
+        # receiver on the GUI thread is automatically queued by Qt, so the old
+        # QTimer.singleShot indirection only added a timer event per signal.
 
-        if not self._is_running:
-            print(f"[ConvThread {thread_id}] Worker not started, already cancelled.")
-            emit_signal(self.conversion_error, "Cancelled", "Operation cancelled before starting.", self.file_path)
+        if self._cancel_event.is_set():
+            logger.debug("[ConvThread %s] Worker not started, already cancelled.", thread_id)
+            self.signals.conversion_error.emit("Cancelled", "Operation cancelled before starting.", self.file_path)
             return
 
-        base_name = os.path.basename(self.file_path)
         try:
-            print(f"[ConvThread {thread_id}] Starting conversion for: {self.file_path}")
-            emit_signal(self.progress_update, f"Initializing conversion for '{base_name}'...")
-
-            # Short sleep to allow UI update, check for cancellation
-            time.sleep(0.1)
-            if not self._is_running: raise RuntimeError("Operation cancelled during init.")
-
-            # Initialize the loader
-            loader = self.DoclingLoaderClass(file_path=self.file_path, export_type="markdown")
-            print(f"[ConvThread {thread_id}] Loader initialized.")
-            emit_signal(self.progress_update, f"Loading and converting '{base_name}'...")
+            logger.debug("[ConvThread %s] Starting conversion for: %s", thread_id, self.file_path)
+            self.signals.progress_update.emit(STAGE_INITIALIZING, self.file_path)
+
+            # Check for cancellation before doing any real work. (The old
+            # 100ms sleeps "to allow UI update" predate the worker thread: the
+            # UI paints on its own thread now, so they only added latency.)
+            if self._cancel_event.is_set(): raise RuntimeError("Operation cancelled during init.")
+
+            # Re-validate the path with one stat() just before working on it:
+            # a queued batch file may have been moved or deleted since
+            # process_files checked it. Failing here is a cheap, clear OSError
+            # instead of whatever docling raises deep inside loader.load().
+            os.stat(self.file_path)
+
+            # --- Conversion cache lookup ---
+            # An unchanged file (same content hash) is served straight from the
+            # on-disk cache, skipping the docling pipeline entirely.
+            file_hash = _hash_file(self.file_path)
+            if file_hash:
+                cached_markdown = _conversion_cache_load(file_hash)
+                if cached_markdown:
+                    logger.debug("[ConvThread %s] Cache hit for: %s", thread_id, self.file_path)
+                    self.signals.conversion_complete.emit(cached_markdown, self.file_path)
+                    return
+
+            # Initialize the loader. Reusing the shared converter keeps the
+            # docling models loaded across conversions instead of paying the
+            # pipeline construction cost for every file.
+            if self.converter is not None:
+                try:
+                    loader = self.DoclingLoaderClass(
+                        file_path=self.file_path, export_type="markdown",
+                        converter=self.converter
+                    )
+                except TypeError:
+                    # Older langchain_docling without a `converter` parameter
+                    loader = self.DoclingLoaderClass(file_path=self.file_path, export_type="markdown")
+            else:
+                loader = self.DoclingLoaderClass(file_path=self.file_path, export_type="markdown")
+            logger.debug("[ConvThread %s] Loader initialized.", thread_id)
+            self.signals.progress_update.emit(STAGE_CONVERTING, self.file_path)
 
-            # Short sleep, check for cancellation
-            time.sleep(0.1)
-            if not self._is_running: raise RuntimeError("Operation cancelled before load.")
+            # Check for cancellation again before the slow part
+            if self._cancel_event.is_set(): raise RuntimeError("Operation cancelled before load.")
 
             # --- THE SLOW PART ---
-            print(f"[ConvThread {thread_id}] Calling loader.load()...")
-            docs = loader.load()
-            print(f"[ConvThread {thread_id}] loader.load() finished.")
+            # Docling has no cancellation callback, but iterating lazy_load()
+            # lets a cancel request take effect between documents instead of
+            # only after a monolithic load() returns. Content streams straight
+            # into one buffer, so no doc list is retained at all.
+            logger.debug("[ConvThread %s] Iterating loader documents...", thread_id)
+            lazy_load = getattr(loader, 'lazy_load', None)
+            doc_iter = lazy_load() if callable(lazy_load) else loader.load()
+            buffer = io.StringIO()
+            saw_documents = False
+            for doc in doc_iter:
+                if self._cancel_event.is_set(): raise RuntimeError("Operation cancelled during load.")
+                saw_documents = True
+                content = getattr(doc, 'page_content', None)
+                if content:
+                    if buffer.tell():
+                        buffer.write("\n\n")
+                    buffer.write(content)
+                    # Let the GUI show this document while the next converts
+                    self.signals.conversion_chunk.emit(content, self.file_path)
+            logger.debug("[ConvThread %s] Document iteration finished.", thread_id)
             # ---------------------
 
-            # Check for cancellation immediately after the blocking call
-            if not self._is_running: raise RuntimeError("Operation cancelled during load.")
+            # Check for cancellation immediately after the blocking iteration
+            if self._cancel_event.is_set(): raise RuntimeError("Operation cancelled during load.")
+
+            markdown = buffer.getvalue() if saw_documents else None
+
+            # Populate the cache for next time (only when there is real content)
+            if file_hash and markdown:
+                _conversion_cache_store(file_hash, markdown)
 
             # If successful, emit completion signal
-            print(f"[ConvThread {thread_id}] Conversion successful for: {self.file_path}")
-            emit_signal(self.conversion_complete, docs, self.file_path)
-
-        except RuntimeError as e:
-             # Handle cancellation specifically
-             if "cancelled" in str(e).lower():
-                 print(f"[ConvThread {thread_id}] Conversion cancelled.")
-                 emit_signal(self.conversion_error, "Cancelled", "Operation was cancelled by user.", self.file_path)
-             else:
-                 # Handle other RuntimeErrors
-                 error_type = type(e).__name__
-                 tb_str = traceback.format_exc()
-                 print(f"[ConvThread {thread_id}] Unexpected RuntimeError: {e}\n{tb_str}")
-                 emit_signal(self.conversion_error, error_type, str(e), self.file_path)
+            logger.debug("[ConvThread %s] Conversion successful for: %s", thread_id, self.file_path)
+            self.signals.conversion_complete.emit(markdown, self.file_path)
 
-        except OSError as e:
-            # Handle OS-level errors (file not found, permissions)
-            error_type = type(e).__name__
-            error_message = f"OS Error during conversion: {e}"
-            print(f"[ConvThread {thread_id}] {error_message}")
-            # Check if cancellation happened concurrently
-            final_error_type = "Cancelled" if not self._is_running else error_type
-            final_error_msg = "Operation cancelled after OS error." if not self._is_running else str(e)
-            emit_signal(self.conversion_error, final_error_type, final_error_msg, self.file_path)
-        except ImportError as e:
-            # Handle missing dependencies if import happens here (less likely with init thread)
-            error_type = type(e).__name__
-            error_message = f"Import Error during conversion: {e}"
-            print(f"[ConvThread {thread_id}] {error_message}")
-            final_error_type = "Cancelled" if not self._is_running else error_type
-            final_error_msg = "Operation cancelled after Import error." if not self._is_running else str(e)
-            emit_signal(self.conversion_error, final_error_type, final_error_msg, self.file_path)
         except Exception as e:
-            # Catch any other unexpected exceptions
-            error_type = type(e).__name__
-            error_message = f"Unexpected error during conversion: {e}"
-            tb_str = traceback.format_exc()
-            print(f"[ConvThread {thread_id}] {error_message}\n{tb_str}")
-            final_error_type = "Cancelled" if not self._is_running else error_type
-            final_error_msg = f"Operation cancelled after {error_type}." if not self._is_running else str(e)
-            emit_signal(self.conversion_error, final_error_type, final_error_msg, self.file_path)
+            # All failure modes funnel through one dispatch method instead of
+            # four near-identical handlers.
+            self._dispatch_error(e, thread_id)
         finally:
              # This block executes whether an exception occurred or not
-             print(f"[ConvThread {thread_id}] Conversion run method finished.")
+             logger.debug("[ConvThread %s] Conversion run method finished.", thread_id)
         # The thread's event loop should continue running until quit() is called.
 
-    @Slot()
+    def _dispatch_error(self, exc, thread_id):
+        """Maps any run() exception to a single conversion_error emission."""
+        error_type = type(exc).__name__
+
+        # Explicit cancellation raises RuntimeError from the checkpoints
+        if isinstance(exc, RuntimeError) and "cancelled" in str(exc).lower():
+            logger.debug("[ConvThread %s] Conversion cancelled.", thread_id)
+            self.signals.conversion_error.emit("Cancelled", "Operation was cancelled by user.", self.file_path)
+            return
+
+        # Expected failure classes (bad files, missing deps) get a warning;
+        # anything else is unexpected and logged with its traceback.
+        if isinstance(exc, (OSError, ImportError)):
+            logger.warning("[ConvThread %s] %s during conversion: %s", thread_id, error_type, exc)
+        else:
+            logger.exception(f"[ConvThread {thread_id}] Unexpected error during conversion: {exc}")
+
+        # A concurrent cancel request outranks the error itself
+        if self._cancel_event.is_set():
+            self.signals.conversion_error.emit("Cancelled", f"Operation cancelled after {error_type}.", self.file_path)
+        else:
+            self.signals.conversion_error.emit(error_type, str(exc), self.file_path)
+
     def stop(self):
         """Signals the worker to stop (best effort)."""
-        print(f"[ConvThread {threading.get_ident()}] Received stop signal.")
-        self._is_running = False
+        logger.debug("[ConvThread %s] Received stop signal.", threading.get_ident())
+        self._cancel_event.set()
+
+
+# ==============================================================
+# Worker for Saving (runs on the global QThreadPool)
+# ==============================================================
+class SaveSignals(QObject):
+    """Signal holder for SaveWorker (QRunnable cannot own signals)."""
+    save_complete = Signal(str) # Emits the saved file path
+    save_error = Signal(str, str) # Emits error type, message
+
+
+class SaveWorker(QRunnable):
+    """Runnable that writes markdown to disk off the GUI thread."""
+
+    def __init__(self, file_path, markdown_text):
+        super().__init__()
+        self.signals = SaveSignals()
+        # The app keeps a reference until a result signal arrives
+        self.setAutoDelete(False)
+        self.file_path = file_path
+        self.markdown_text = markdown_text
+
+    def run(self):
+        try:
+            # QSaveFile: one buffered write into a temp file that is
+            # atomically renamed on commit, so a failed save never leaves a
+            # truncated file behind.
+            save_file = QSaveFile(self.file_path)
+            if not save_file.open(QIODevice.OpenModeFlag.WriteOnly):
+                raise OSError(save_file.errorString())
+            save_file.write(self.markdown_text.encode('utf-8'))
+            if not save_file.commit():
+                raise OSError(save_file.errorString())
+        except OSError as e:
+            self.signals.save_error.emit("OSError", str(e))
+        except Exception as e:
+            logger.exception(f"Save Error: {e}")
+            self.signals.save_error.emit(type(e).__name__, str(e))
+        else:
+            self.signals.save_complete.emit(self.file_path)
 
 
 # ==============================================================
 # Main Application Window
 # ==============================================================
 class MarkdownConverterApp(QMainWindow):
+    # Queued request for an error popup; delivery happens from the event loop
+    # without allocating a QTimer + closure per error.
+    _error_requested = Signal(str)
+
+    # --- Frozen QSS (interpolated once at class-creation time) ---
+    _BUTTON_MIN_HEIGHT = 40
+    _BUTTON_PADDING = "8px 15px"
+    _BORDER_RADIUS = "5px"
+
+    WINDOW_STYLE = f"""
+        QPushButton {{
+            min-height: {_BUTTON_MIN_HEIGHT}px;
+            padding: {_BUTTON_PADDING};
+            border-radius: {_BORDER_RADIUS};
+            font-size: 11pt;
+            /* Add default background/color if needed */
+        }}
+        QPushButton:disabled {{
+            background-color: #4a4a4a; /* Example disabled style */
+            color: #888;
+        }}
+        QPlainTextEdit#markdownOutput {{
+            border: 1px solid #555;
+            border-radius: {_BORDER_RADIUS};
+            padding: 10px;
+            background-color: #282828;
+            font-size: 10pt;
+        }}
+        QPlainTextEdit#markdownOutput:disabled {{
+            background-color: #333333;
+            color: #888;
+        }}
+        QLabel#statusLabel {{
+            color: #999;
+            padding-top: 5px;
+            font-size: 9pt;
+        }}
+        QLabel#statusLabel[statusRole="success"] {{ color: #2ecc71; }}
+        QLabel#statusLabel[statusRole="processing"] {{ color: #f39c12; }}
+        QLabel#statusLabel[statusRole="error"] {{ color: #e74c3c; }}
+        QLabel#dropLabel {{
+            border: 2px dashed #666;
+            padding: 40px 20px;
+            border-radius: {_BORDER_RADIUS};
+            background-color: #2a2a2a;
+            font-size: 11pt;
+            color: #aaa;
+        }}
+        QLabel#dropLabel:disabled {{
+            background-color: #333333;
+            border-color: #444;
+            color: #666;
+        }}
+        QLabel#dropLabel[dragHover="true"] {{
+            border: 2px dashed #bbb; /* Brighter border on hover */
+            background-color: #3a3a3a; /* Slightly lighter background */
+            color: #eee;
+        }}
+    """
+
+    # File-dialog filters, built once instead of per dialog invocation
+    OPEN_FILE_FILTERS = (
+        "All Supported Files (*.pdf *.docx *.pptx *.html *.htm);;"
+        "PDF Files (*.pdf);;"
+        "Word Documents (*.docx);;"
+        "PowerPoint Files (*.pptx);;"
+        "HTML Files (*.html *.htm);;"
+        "All Files (*)"
+    )
+    SAVE_FILE_FILTERS = "Markdown Files (*.md);;Text Files (*.txt);;All Files (*)"
+
+    # Mime types matching OPEN_FILE_FILTERS; dragged files are checked against
+    # these through QMimeDatabase instead of by suffix string comparisons.
+    SUPPORTED_MIME_TYPES = frozenset({
+        'application/pdf',
+        'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+        'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+        'text/html',
+    })
+
     def __init__(self):
         super().__init__()
         self.setGeometry(100, 100, 800, 650)
@@ -201,31 +575,98 @@ class MarkdownConverterApp(QMainWindow):
         self.original_status_text = "Initializing..."
         self.ready_status_text = "Ready. Select a file or drag it here."
         self.last_processed_file = None
+        self.last_processed_base = None # Cached basename of last_processed_file
+        self._suggested_save_name = "output.md" # Save-dialog default filename
+        self._status_is_processing = False # Whether a processing status is on display
+        self._ui_blocked = False # True once the UI is disabled for good (init failure)
         self.DoclingLoaderClass = None # Will hold the imported class
+        self.is_ready = False         # True once initialization has completed
+        self.shared_converter = None  # Pre-warmed docling converter, reused across files
         self.is_processing = False    # Flag to prevent concurrent operations
+        self._current_markdown = ""   # The markdown currently shown (output is read-only)
+        self._last_dialog_dir = ""    # Directory the open/save dialogs resume in
+        self._pending_drop_paths = None # Paths resolved during dragEnterEvent
+        # One mime database for drag validation (construction is not free)
+        self._mime_db = QMimeDatabase()
 
         # --- Threading Attributes ---
-        self.init_thread = None
-        self.init_worker = None
-        self.conversion_thread = None
-        self.conversion_worker = None # Renamed from self.worker for clarity
+        self.init_worker = None # Runnable on the global pool while initializing
+        # Dedicated pool for conversions. Docling's DocumentConverter is not
+        # thread-safe and each extra converter would reload the models, so the
+        # pool defaults to one conversion at a time; additional batch files
+        # wait in its queue instead of each spawning a QThread up front.
+        # DOCUMARK_PARALLEL_CONVERSIONS opts into wider pools on machines with
+        # the memory for a model-loaded converter per thread.
+        self.conversion_pool = QThreadPool(self)
+        try:
+            parallel = int(os.environ.get('DOCUMARK_PARALLEL_CONVERSIONS', '1'))
+        except ValueError:
+            parallel = 1
+        self._parallel_conversions = max(1, min(parallel, os.cpu_count() or 1))
+        self.conversion_pool.setMaxThreadCount(self._parallel_conversions)
+        self.active_workers = {}  # file_path -> ConversionWorker for the current batch
+        self._batch_order = []    # Batch files in submission order
+        self._batch_results = {}  # file_path -> converted markdown
+        self._batch_done = 0      # Completed (or failed) files in the batch
+        self._streamed_to_output = False # Output pane already shows streamed pages
+        self._batch_finalized = True     # No batch in flight yet; see _finalize_batch
+        self._save_workers = set()       # In-flight background save workers
+        # Coalesces bursts of update_action_buttons_state requests (created
+        # here, before any signal connection can fire one)
+        self._buttons_update_timer = QTimer(self)
+        self._buttons_update_timer.setSingleShot(True)
+        self._buttons_update_timer.setInterval(0)
+        self._buttons_update_timer.timeout.connect(self._apply_action_buttons_state)
 
         # --- UI Elements ---
         self.progress_dialog = None # Reference to the progress dialog
 
+        # One reusable single-shot timer reverts temporary status messages;
+        # restarted on each temporary status instead of allocating a fresh
+        # QTimer + closure per call.
+        self._status_revert_timer = QTimer(self)
+        self._status_revert_timer.setSingleShot(True)
+        self._status_revert_timer.setInterval(3000)
+        self._status_revert_timer.timeout.connect(self._revert_temporary_status)
+        self._status_revert_message = None  # Message the pending revert belongs to
+        self._status_revert_baseline = None # Baseline to revert to
+
+        # Progress-label updates are coalesced to at most ~20 Hz: workers can
+        # emit faster than repainting a modal label is worth, so only the
+        # latest pending stage is rendered when the throttle fires.
+        self._progress_throttle = QTimer(self)
+        self._progress_throttle.setSingleShot(True)
+        self._progress_throttle.setInterval(50)
+        self._progress_throttle.timeout.connect(self._flush_progress_update)
+        self._pending_progress = None # Latest (stage, file_path) awaiting display
+
         # --- Central Widget & Layout ---
+        # A QStackedWidget holds the loading page and the main page; switching
+        # is a single setCurrentWidget call instead of hiding, re-parenting and
+        # layout-shuffling individual widgets. The status label lives below the
+        # stack and is visible in both states.
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
         self.main_layout = QVBoxLayout(self.central_widget)
         self.main_layout.setContentsMargins(20, 20, 20, 15)
         self.main_layout.setSpacing(15)
-        self.main_layout.setAlignment(Qt.AlignmentFlag.AlignCenter) # Initially center loading
 
-        # --- Loading State Widgets ---
+        self.page_stack = QStackedWidget()
+        self.main_layout.addWidget(self.page_stack, 1)
+
+        # --- Loading Page ---
+        # One QFont instance serves every styled label: setFont copies the
+        # value, so the same object can be retuned between uses.
+        label_font = QFont()
+
+        self.loading_page = QWidget()
+        loading_layout = QVBoxLayout(self.loading_page)
+        loading_layout.setSpacing(15)
+        loading_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
         self.loading_label = QLabel("🚀 Initializing DocuMark Transformer...")
-        loading_font = QFont()
-        loading_font.setPointSize(14)
-        self.loading_label.setFont(loading_font)
+        label_font.setPointSize(14)
+        self.loading_label.setFont(label_font)
         self.loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.loading_label.setStyleSheet("color: #cccccc; padding-bottom: 10px;")
 
@@ -235,34 +676,46 @@ class MarkdownConverterApp(QMainWindow):
         self.init_progress_bar.setMaximumHeight(10)
         self.init_progress_bar.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
 
-        self.main_layout.addWidget(self.loading_label)
-        self.main_layout.addWidget(self.init_progress_bar)
-        self.main_layout.addStretch(1) # Keep loading UI centered vertically
+        loading_layout.addStretch(1)
+        loading_layout.addWidget(self.loading_label)
+        loading_layout.addWidget(self.init_progress_bar)
+        loading_layout.addStretch(1) # Keep loading UI centered vertically
+        self.page_stack.addWidget(self.loading_page)
+
+        # --- Main Page ---
+        self.main_page = QWidget()
+        main_page_layout = QVBoxLayout(self.main_page)
+        main_page_layout.setContentsMargins(0, 0, 0, 0)
+        main_page_layout.setSpacing(15)
 
-        # --- Main UI Widgets (Created but initially hidden) ---
         self.title_label = QLabel("✨ DocuMark Transformer ✨")
-        title_font = QFont()
-        title_font.setPointSize(16); title_font.setBold(True)
-        self.title_label.setFont(title_font)
+        label_font.setPointSize(16); label_font.setBold(True)
+        self.title_label.setFont(label_font)
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.title_label.setStyleSheet("padding-bottom: 10px; color: #5dade2;")
-        self.title_label.setVisible(False)
 
         self.open_button = QPushButton("📂 Open Document or HTML File")
-        self.open_button.setVisible(False)
 
         self.drop_label = QLabel("📄 ... or drag and drop a file here.")
         self.drop_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.drop_label.setVisible(False)
 
-        self.markdown_output = QTextEdit()
+        # Batch file list: a QStringListModel-backed view updates one row per
+        # file-status change instead of accumulating text. Hidden for
+        # single-file conversions.
+        self.batch_list_model = QStringListModel(self)
+        self.batch_list_view = QListView()
+        self.batch_list_view.setModel(self.batch_list_model)
+        self.batch_list_view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.batch_list_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.batch_list_view.setMaximumHeight(110)
+        self.batch_list_view.setVisible(False)
+
+        self.markdown_output = QPlainTextEdit()
         self.markdown_output.setReadOnly(True)
         self.markdown_output.setPlaceholderText("Converted Markdown will appear here...")
-        self.markdown_output.setVisible(False)
 
-        # Use a container widget for the button layout for easier hiding/showing
+        # Container widget keeps the action buttons as one layout row
         self.button_layout_widget = QWidget()
-        self.button_layout_widget.setVisible(False)
         self.button_layout = QHBoxLayout(self.button_layout_widget)
         self.copy_button = QPushButton("📋 Copy Markdown")
         self.save_button = QPushButton("💾 Save as Markdown")
@@ -279,80 +732,32 @@ class MarkdownConverterApp(QMainWindow):
         # Status label is added later
 
         # --- Apply Styles to hidden widgets ---
-        button_min_height = 40
-        button_padding = "8px 15px"; border_radius = "5px"
-        common_button_style = f"""
-            QPushButton {{
-                min-height: {button_min_height}px;
-                padding: {button_padding};
-                border-radius: {border_radius};
-                font-size: 11pt;
-                /* Add default background/color if needed */
-            }}
-            QPushButton:disabled {{
-                background-color: #4a4a4a; /* Example disabled style */
-                color: #888;
-            }}
-        """
-        self.open_button.setStyleSheet(common_button_style)
-        self.copy_button.setStyleSheet(common_button_style)
-        self.save_button.setStyleSheet(common_button_style)
+        # One window-level stylesheet instead of a setStyleSheet call per
+        # widget: Qt resolves a single sheet once rather than parsing and
+        # cascading six separate ones. All QSS strings are frozen class
+        # constants, built exactly once at class-creation time.
+        self.markdown_output.setObjectName("markdownOutput")
+        self.setStyleSheet(self.WINDOW_STYLE)
 
         icon_size = QSize(18, 18); self.open_button.setIconSize(icon_size); self.copy_button.setIconSize(icon_size); self.save_button.setIconSize(icon_size)
 
-        # Define base and hover styles for drop label
-        self.base_drop_style = f"""
-            QLabel {{
-                border: 2px dashed #666;
-                padding: 40px 20px;
-                border-radius: {border_radius};
-                background-color: #2a2a2a;
-                font-size: 11pt;
-                color: #aaa;
-            }}
-            QLabel:disabled {{
-                background-color: #333333;
-                border-color: #444;
-                color: #666;
-            }}
-        """
-        self.hover_drop_style = f"""
-            QLabel {{
-                border: 2px dashed #bbb; /* Brighter border on hover */
-                padding: 40px 20px;
-                border-radius: {border_radius};
-                background-color: #3a3a3a; /* Slightly lighter background */
-                font-size: 11pt;
-                color: #eee;
-            }}
-        """
-        self.drop_label.setStyleSheet(self.base_drop_style)
-
-        self.markdown_output.setStyleSheet(f"""
-            QTextEdit {{
-                border: 1px solid #555;
-                border-radius: {border_radius};
-                padding: 10px;
-                background-color: #282828;
-                font-size: 10pt;
-            }}
-            QTextEdit:disabled {{
-                background-color: #333333;
-                color: #888;
-            }}
-        """)
-
-        self.status_label.setStyleSheet("QLabel { color: #999; padding-top: 5px; font-size: 9pt; }")
-
-        # --- Add Main UI Widgets to Layout (Initially Hidden) ---
-        # Insert before the stretch item and the status label which will be added last
-        insert_index = self.main_layout.count() - 1 # Index before the stretch item
-        self.main_layout.insertWidget(insert_index, self.title_label)
-        self.main_layout.insertWidget(insert_index + 1, self.open_button)
-        self.main_layout.insertWidget(insert_index + 2, self.drop_label)
-        self.main_layout.insertWidget(insert_index + 3, self.markdown_output, 1) # Stretch factor 1
-        self.main_layout.insertWidget(insert_index + 4, self.button_layout_widget)
-        self.main_layout.addWidget(self.status_label) # Add status label at the very end
+        # Drop-label styling (base, disabled, hover) lives in the window
+        # sheet, toggled via the dragHover property
+        self.drop_label.setObjectName("dropLabel")
+
+        # Status colors come from the window sheet via the statusRole property
+        self.status_label.setObjectName("statusLabel")
+
+        # --- Assemble the main page and the shared status label ---
+        main_page_layout.addWidget(self.title_label)
+        main_page_layout.addWidget(self.open_button)
+        main_page_layout.addWidget(self.drop_label)
+        main_page_layout.addWidget(self.batch_list_view)
+        main_page_layout.addWidget(self.markdown_output, 1) # Stretch factor 1
+        main_page_layout.addWidget(self.button_layout_widget)
+        self.page_stack.addWidget(self.main_page)
+
+        self.main_layout.addWidget(self.status_label) # Below the stack, always visible
 
         # --- Enable Drag and Drop ---
         self.setAcceptDrops(True) # Enable drops on the main window
@@ -362,100 +767,68 @@ class MarkdownConverterApp(QMainWindow):
         self.copy_button.clicked.connect(self.copy_markdown_to_clipboard)
         self.save_button.clicked.connect(self.save_markdown_to_file)
         self.markdown_output.textChanged.connect(self.update_action_buttons_state)
+        self._error_requested.connect(self._show_error_box, Qt.ConnectionType.QueuedConnection)
 
         # --- Start Initialization Thread ---
-        # Use QTimer.singleShot to ensure the main event loop is running first
-        QTimer.singleShot(50, self.start_initialization_thread)
+        # Kicked off from the first showEvent (see below) so startup work
+        # begins right after the window is up, not on an arbitrary 50ms timer.
+        self._init_started = False
 
     # --- Initialization Handling ---
+    def showEvent(self, event):
+        """Starts backend initialization right after the window first shows."""
+        super().showEvent(event)
+        if not self._init_started:
+            self._init_started = True
+            # Zero-timer: let this paint cycle finish, then start the worker
+            QTimer.singleShot(0, self.start_initialization_thread)
+
     @Slot()
     def start_initialization_thread(self):
-        """Sets up and starts the initialization worker thread."""
-        if self.init_thread: # Prevent starting if already running
-             print("Initialization thread already exists.")
+        """Submits the initialization worker to the global thread pool."""
+        if self.init_worker: # Prevent starting if already running
+             logger.debug("Initialization worker already exists.")
              return
-        print("Starting initialization thread setup...")
-        self.init_thread = QThread(self)
+        logger.debug("Starting initialization worker setup...")
         self.init_worker = InitializationWorker()
-        self.init_worker.moveToThread(self.init_thread)
 
         # Connect signals from worker to main thread slots
-        self.init_worker.initialization_complete.connect(self.handle_initialization_complete)
-        self.init_worker.initialization_error.connect(self.handle_initialization_error)
-
-        # Connect thread signals
-        self.init_thread.started.connect(self.init_worker.run)
-        # Clean up worker and thread when the thread finishes
-        self.init_thread.finished.connect(self.init_worker.deleteLater)
-        self.init_thread.finished.connect(self.init_thread.deleteLater)
-        # Also clear our references when the thread is finished
-        self.init_thread.finished.connect(self._clear_init_thread_references)
-
-        print("Starting initialization thread...")
-        self.init_thread.start()
-
-    @Slot(object)
-    def handle_initialization_complete(self, imported_class):
+        self.init_worker.signals.initialization_complete.connect(self.handle_initialization_complete)
+        self.init_worker.signals.initialization_error.connect(self.handle_initialization_error)
+
+        logger.debug("Submitting initialization worker to thread pool...")
+        QThreadPool.globalInstance().start(self.init_worker)
+
+    @Slot(object, object)
+    def handle_initialization_complete(self, imported_class, shared_converter=None):
         """Handles successful initialization."""
-        print("Handling initialization complete.")
+        logger.debug("Handling initialization complete.")
         self.DoclingLoaderClass = imported_class
+        self.shared_converter = shared_converter
+        self.is_ready = True
+        self.init_worker = None # Done with the runnable; let it be collected
         self.show_main_ui()
-        # References cleared via _clear_init_thread_references slot
 
     @Slot(str, str)
     def handle_initialization_error(self, error_type, error_message):
         """Handles errors during initialization."""
-        print(f"Handling initialization Error ({error_type}): {error_message}")
+        logger.debug("Handling initialization Error (%s): %s", error_type, error_message)
         msg = f"Failed to initialize application.\n\nError: {error_type}: {error_message}\n\n"
         if error_type == "ImportError":
              msg += "Please ensure 'langchain-docling' and its dependencies are installed correctly.\n(e.g., pip install langchain-docling)"
         else:
              msg += "See console output for more details."
 
+        self.init_worker = None # Done with the runnable; let it be collected
         self.show_initialization_error(msg)
-        # References cleared via _clear_init_thread_references slot
-
-    @Slot()
-    def _clear_init_thread_references(self):
-        """Slot connected to init_thread.finished to clear references."""
-        print("Clearing init thread/worker references.")
-        self.init_worker = None
-        self.init_thread = None
 
     @Slot()
     def show_main_ui(self):
-        """Hides loading indicators and shows the main application UI."""
-        print("Showing main UI.")
-        # Hide loading widgets
-        self.loading_label.setVisible(False)
-        self.init_progress_bar.setVisible(False)
-        # Remove them from layout to reclaim space (optional but cleaner)
-        self.main_layout.removeWidget(self.loading_label)
-        self.main_layout.removeWidget(self.init_progress_bar)
-
-        # Remove the stretch item added for centering the loading UI
-        items_to_remove = []
-        for i in range(self.main_layout.count()):
-            item = self.main_layout.itemAt(i)
-            # Check if it's a QSpacerItem and it provides vertical stretch
-            if isinstance(item, QSpacerItem) and item.expandingDirections() == Qt.Orientation.Vertical:
-                items_to_remove.append(item)
-                print("Found potential loading stretch item.")
-        # Remove found stretch items
-        for item in items_to_remove:
-            self.main_layout.removeItem(item)
-            print("Removed loading stretch item.")
-
-        # Change layout alignment now that content is present
-        self.main_layout.setAlignment(Qt.AlignmentFlag.AlignTop) # Align main content to top
-
-        # Show the main widgets
-        self.title_label.setVisible(True)
-        self.open_button.setVisible(True)
-        self.drop_label.setVisible(True)
-        self.markdown_output.setVisible(True)
-        self.button_layout_widget.setVisible(True)
-        self.status_label.setVisible(True) # Ensure status label is visible
+        """Switches the page stack from the loading page to the main UI."""
+        logger.debug("Showing main UI.")
+        # One flip of the stacked widget replaces the old hide/remove/realign
+        # dance across individual widgets.
+        self.page_stack.setCurrentWidget(self.main_page)
 
         # Update window state
         self.setWindowTitle("DocuMark Transformer - Convert Documents to Markdown")
@@ -468,23 +841,22 @@ class MarkdownConverterApp(QMainWindow):
     @Slot()
     def show_initialization_error(self, message):
         """Displays a critical error message if initialization fails."""
-        print(f"Displaying initialization error: {message}")
-        # Hide loading indicators even on error
-        self.loading_label.setVisible(False)
+        logger.debug("Displaying initialization error: %s", message)
+        # Stop the indeterminate animation; the loading page itself stays up
+        # as the backdrop for the failure state.
         self.init_progress_bar.setVisible(False)
-        # Optionally remove them
-        self.main_layout.removeWidget(self.loading_label)
-        self.main_layout.removeWidget(self.init_progress_bar)
+        self.loading_label.setText("❌ Initialization Failed")
 
-        # Update status to indicate failure
+        # Update status to indicate failure (the ❌ marks it as an error, so
+        # set_status picks the error role/color)
         self.set_status("❌ Initialization Failed!")
-        self.status_label.setStyleSheet("color: #e74c3c; padding-top: 5px; font-size: 9pt;") # Error color
 
         # Show a critical message box
         QMessageBox.critical(self, "Initialization Error", message)
 
         # Disable the main UI as the app can't function
         self.central_widget.setEnabled(False)
+        self._ui_blocked = True # Future error popups are suppressed to the log
         # Optionally disable the whole window, but disabling central widget is usually enough
         # self.setEnabled(False)
 
@@ -492,56 +864,89 @@ class MarkdownConverterApp(QMainWindow):
     # --- Event Handlers (Drag/Drop, Open) ---
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handles drag enter events."""
-        # Accept drops only if initialized, not processing, and data is a single local file URL
+        # Accept drops only if initialized, not processing, and every URL is a
+        # local file. Multiple files are fine — they are queued as a batch.
         if self.DoclingLoaderClass and not self.is_processing:
             mime_data = event.mimeData()
             if mime_data.hasUrls():
                 urls = mime_data.urls()
-                if len(urls) == 1:
-                    url = urls[0]
-                    # Check if it's a local file (works for most OS) or use macOS workaround
-                    is_local = url.isLocalFile()
-                    is_macos_file = MACOS_DRAG_DROP_WORKAROUND and url.scheme() == 'file'
-                    if is_local or is_macos_file:
-                        event.acceptProposedAction()
-                        self.drop_label.setStyleSheet(self.hover_drop_style) # Provide visual feedback
-                        return # Accepted
+                # Resolve plain local files right here so dropEvent does not
+                # have to re-parse the same URLs; anything needing the macOS
+                # workaround is left for dropEvent's full resolution path.
+                resolved = []
+                acceptable = bool(urls)
+                for url in urls:
+                    if url.isLocalFile():
+                        # Let the mime database (content + extension aware)
+                        # veto clearly unsupported types; unknown content
+                        # (octet-stream) is given the benefit of the doubt.
+                        mime = self._mime_db.mimeTypeForUrl(url)
+                        mime_name = mime.name()
+                        if (mime_name not in self.SUPPORTED_MIME_TYPES
+                                and not mime.isDefault()):
+                            acceptable = False
+                            break
+                        if resolved is not None:
+                            resolved.append(url.toLocalFile())
+                    elif MACOS_DRAG_DROP_WORKAROUND and url.scheme() == 'file':
+                        resolved = None # Mixed/macOS case: re-resolve at drop time
+                    else:
+                        acceptable = False
+                        break
+                if acceptable:
+                    self._pending_drop_paths = resolved if resolved else None
+                    event.acceptProposedAction()
+                    self._set_drop_hover(True) # Provide visual feedback
+                    return # Accepted
+        self._pending_drop_paths = None
         event.ignore() # Ignore in all other cases
 
     def dragLeaveEvent(self, event):
         """Handles drag leave events."""
+        self._pending_drop_paths = None # The cached resolution is stale now
         # Reset drop label style if it's enabled
         if self.drop_label.isEnabled():
-            self.drop_label.setStyleSheet(self.base_drop_style)
+            self._set_drop_hover(False)
         event.accept()
 
     def dropEvent(self, event: QDropEvent):
         """Handles drop events."""
         # Reset drop label style first
         if self.drop_label.isEnabled():
-             self.drop_label.setStyleSheet(self.base_drop_style)
+             self._set_drop_hover(False)
 
         # Check conditions again (safety)
         if not (self.DoclingLoaderClass and not self.is_processing):
             event.ignore()
             return
 
+        # Fast path: dragEnterEvent already resolved plain local files
+        if self._pending_drop_paths:
+            file_paths = self._pending_drop_paths
+            self._pending_drop_paths = None
+            logger.debug("Files dropped (pre-resolved): %s", file_paths)
+            event.acceptProposedAction()
+            self.process_files(file_paths)
+            return
+
         mime_data = event.mimeData()
         if mime_data.hasUrls():
-            urls = mime_data.urls()
-            if urls: # Should be exactly one due to dragEnterEvent logic
-                url = urls[0]
-                file_path = ""
+            file_paths = []
+            for url in mime_data.urls():
                 if url.isLocalFile():
-                    file_path = url.toLocalFile()
+                    file_paths.append(url.toLocalFile())
                 elif MACOS_DRAG_DROP_WORKAROUND and url.scheme() == 'file':
-                    # macOS specific handling using Foundation
+                    # macOS specific handling using Foundation (imported lazily)
+                    NSURL = _get_nsurl()
+                    if NSURL is None:
+                        self.show_error(f"Cannot resolve macOS file URL (PyObjC unavailable): {url.toString()}")
+                        event.ignore(); return
                     try:
                         # Create an NSURL object from the string representation of the QUrl
                         ns_url = NSURL.URLWithString_(url.toString())
                         # Check if it's a file URL and get the path
                         if ns_url and ns_url.isFileURL():
-                            file_path = str(ns_url.path()) # Get path string
+                            file_paths.append(str(ns_url.path())) # Get path string
                         else:
                             self.show_error(f"Cannot resolve non-file URL on macOS: {url.toString()}")
                             event.ignore(); return
@@ -553,12 +958,12 @@ class MarkdownConverterApp(QMainWindow):
                     self.show_error(f"Cannot handle non-local file URL: {url.toString()}")
                     event.ignore(); return
 
-                # If we got a valid file path, process it
-                if file_path:
-                    print(f"File dropped: {file_path}")
-                    event.acceptProposedAction()
-                    self.process_file(file_path)
-                    return # Handled
+            # If we got valid file paths, process them as one batch
+            if file_paths:
+                logger.debug("Files dropped: %s", file_paths)
+                event.acceptProposedAction()
+                self.process_files(file_paths)
+                return # Handled
 
         event.ignore() # Ignore if no valid URL found
 
@@ -568,31 +973,26 @@ class MarkdownConverterApp(QMainWindow):
         if not self.DoclingLoaderClass or self.is_processing:
             return # Don't open if not ready or busy
 
-        # Define supported file types
-        supported_filters = (
-            "All Supported Files (*.pdf *.docx *.pptx *.html *.htm);;"
-            "PDF Files (*.pdf);;"
-            "Word Documents (*.docx);;"
-            "PowerPoint Files (*.pptx);;"
-            "HTML Files (*.html *.htm);;"
-            "All Files (*)"
-        )
-
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Document or HTML File",
-            "", # Start directory (empty means default/last used)
-            supported_filters
+            self._last_dialog_dir, # Resume in the last-used directory
+            self.OPEN_FILE_FILTERS
         )
 
         if file_path: # Proceed if a file was selected
-            print(f"File selected via dialog: {file_path}")
+            logger.debug("File selected via dialog: %s", file_path)
+            self._last_dialog_dir = os.path.dirname(file_path)
             self.process_file(file_path)
 
 
     # --- Conversion Process ---
     def process_file(self, file_path: str):
-        """Initiates the file processing in a separate thread with progress dialog."""
+        """Initiates processing of a single file (batch of one)."""
+        self.process_files([file_path])
+
+    def process_files(self, file_paths):
+        """Queues a batch of files for conversion on the worker pool."""
         # Pre-checks
         if not self.DoclingLoaderClass:
             self.show_error("Application is not fully initialized.")
@@ -600,39 +1000,81 @@ class MarkdownConverterApp(QMainWindow):
         if self.is_processing:
             self.show_error("Please wait for the current conversion to complete.")
             return
-        if not os.path.exists(file_path):
-            self.show_error(f"File not found: {file_path}")
+
+        # Accept anything path-like (str, Path, drag-drop results) uniformly,
+        # and validate each file with one stat() (existence + accessibility)
+        # before committing to the batch.
+        valid_paths = []
+        for file_path in file_paths:
+            file_path = os.fspath(file_path)
+            try:
+                os.stat(file_path)
+            except FileNotFoundError:
+                self.show_error(f"File not found: {file_path}")
+                continue
+            except PermissionError:
+                self.show_error(f"Permission denied: Cannot read file\n{file_path}")
+                continue
+            except OSError as e:
+                self.show_error(f"Cannot access file: {e}\n{file_path}")
+                continue
+            # Skip duplicates: workers are keyed by path, so a repeated entry
+            # would overwrite its twin in active_workers and the batch could
+            # never count both completions (wedging the UI).
+            if file_path not in valid_paths:
+                valid_paths.append(file_path)
+
+        if not valid_paths:
             self.reset_status("File access error.")
             return
-        if not os.access(file_path, os.R_OK):
-            self.show_error(f"Permission denied: Cannot read file\n{file_path}")
-            self.reset_status("File permission error.")
-            return
 
         # --- Start Processing State ---
         self.is_processing = True
-        self.last_processed_file = file_path
-        base_name = os.path.basename(file_path)
+        self._batch_order = valid_paths
+        self._batch_results = {}
+        self._batch_done = 0
+        self._batch_finalized = False
+        self.last_processed_file = valid_paths[0]
+        first_path = PurePath(valid_paths[0])
+        self.last_processed_base = first_path.name
+        # Suggested save-dialog filename, derived once per conversion
+        self._suggested_save_name = first_path.stem + ".md" if first_path.stem else "output.md"
+
+        if len(valid_paths) == 1:
+            batch_label = f"'{self.last_processed_base}'"
+        else:
+            batch_label = f"{len(valid_paths)} files"
+
+        # Populate the batch list (multi-file batches only)
+        if len(valid_paths) > 1:
+            self.batch_list_model.setStringList(
+                [f"⏳ {os.path.basename(p)}" for p in valid_paths]
+            )
+            self.batch_list_view.setVisible(True)
+        else:
+            self.batch_list_view.setVisible(False)
 
-        print(f"Starting conversion process for: {file_path}")
-        self.set_status(f"⏳ Preparing conversion for '{base_name}'...", is_processing=True)
+        logger.debug("Starting conversion process for: %s", valid_paths)
+        self.set_status(f"⏳ Preparing conversion for {batch_label}...", is_processing=True)
         self.markdown_output.clear() # Clear previous output
-        self.markdown_output.setPlaceholderText(f"Starting conversion for '{base_name}'...")
+        self._current_markdown = ""
+        self._streamed_to_output = False
+        self.markdown_output.setPlaceholderText(f"Starting conversion for {batch_label}...")
         self.update_action_buttons_state() # Disables copy/save
         self.set_ui_enabled(False) # Disable open/drop during processing
 
         # --- Setup and Show Progress Dialog ---
         # Ensure any previous dialog reference is cleared (safety)
         if self.progress_dialog:
-             print("Warning: Previous progress dialog reference exists. Closing it.")
+             logger.warning("Previous progress dialog reference exists. Closing it.")
              self.progress_dialog.close()
              self.progress_dialog = None
 
         self.progress_dialog = QProgressDialog(
-            f"Converting '{base_name}'...", # Label text
+            f"Converting {batch_label}...", # Label text
             "Cancel",                      # Cancel button text
-            0,                             # Minimum value (0 for indeterminate)
-            0,                             # Maximum value (0 for indeterminate)
+            0,                             # Minimum value
+            len(valid_paths) if len(valid_paths) > 1 else 0, # 0..0 = indeterminate
             self                           # Parent widget
         )
         self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal) # Block main window
@@ -640,260 +1082,343 @@ class MarkdownConverterApp(QMainWindow):
         self.progress_dialog.setAutoClose(False)   # Don't close automatically
         self.progress_dialog.setAutoReset(False)   # Don't reset automatically
         self.progress_dialog.canceled.connect(self.cancel_conversion) # Connect cancel signal
-        print("Showing progress dialog.")
+        logger.debug("Showing progress dialog.")
         self.progress_dialog.show()
-        QApplication.processEvents() # Crucial: Ensure dialog is shown *before* thread starts blocking
-
-        # --- Setup and Start Thread ---
-        # Ensure previous thread references are cleared (safety)
-        if self.conversion_thread:
-             print("Warning: Previous conversion thread reference exists.")
-             # Attempt cleanup if needed, though handle_conversion_finished should do this
-             if self.conversion_thread.isRunning():
-                 self.conversion_thread.quit()
-                 self.conversion_thread.wait(100) # Brief wait
-             self.conversion_thread = None
-             self.conversion_worker = None
-
-        self.conversion_thread = QThread(self)
-        self.conversion_worker = ConversionWorker(self.DoclingLoaderClass, file_path)
-        self.conversion_worker.moveToThread(self.conversion_thread)
-
-        # Connect signals from worker to slots in this main thread
-        self.conversion_worker.conversion_complete.connect(self.handle_conversion_complete)
-        self.conversion_worker.conversion_error.connect(self.handle_conversion_error)
-        # Ensure progress dialog is updated (check if it exists)
-        self.conversion_worker.progress_update.connect(
-            lambda msg: self.progress_dialog.setLabelText(msg) if self.progress_dialog else None
-        )
+        # No explicit processEvents() needed here: the conversions run on pool
+        # threads, so the event loop stays free to paint the dialog normally.
+        # Note the dialog is not re-entrancy-free, though — its setValue()
+        # runs processEvents() internally, which _file_finished and
+        # _finalize_batch are guarded against.
+
+        # --- Create one worker per file and hand them to the pool ---
+        # The pool queues anything beyond its thread budget, so N dropped
+        # files never means N simultaneously constructed pipelines. The shared
+        # converter is only safe while conversions are serialized; with a
+        # wider pool each worker builds its own loader/converter instead.
+        shared = self.shared_converter if self._parallel_conversions == 1 else None
+        for file_path in valid_paths:
+            worker = ConversionWorker(self.DoclingLoaderClass, file_path, shared)
+            worker.signals.conversion_complete.connect(self.handle_conversion_complete)
+            worker.signals.conversion_error.connect(self.handle_conversion_error)
+            worker.signals.progress_update.connect(self.handle_progress_update)
+            worker.signals.conversion_chunk.connect(self.handle_conversion_chunk)
+            self.active_workers[file_path] = worker
+            self.conversion_pool.start(worker)
+
+
+    # Stage code -> progress label template (the GUI owns the strings; the
+    # workers only send ints over the signal)
+    _STAGE_LABELS = {
+        STAGE_INITIALIZING: "Initializing conversion for '{name}'...",
+        STAGE_CONVERTING: "Loading and converting '{name}'...",
+    }
+
+    @Slot(int, str)
+    def handle_progress_update(self, stage, file_path):
+        """Notes a worker's stage; the throttle timer renders the latest one."""
+        self._pending_progress = (stage, file_path)
+        if not self._progress_throttle.isActive():
+            self._progress_throttle.start()
 
-        # Connect thread management signals
-        self.conversion_thread.started.connect(self.conversion_worker.run)
-        # *** CRITICAL: Connect finished signal to the central cleanup slot ***
-        self.conversion_thread.finished.connect(self.handle_conversion_finished)
+    @Slot()
+    def _flush_progress_update(self):
+        """Renders the most recent pending stage onto the progress dialog."""
+        if not self.progress_dialog or self._pending_progress is None:
+            return
+        stage, file_path = self._pending_progress
+        self._pending_progress = None
+        worker = self.active_workers.get(file_path)
+        base_name = worker.base_name if worker else os.path.basename(file_path)
+        template = self._STAGE_LABELS.get(stage)
+        if template:
+            self.progress_dialog.setLabelText(template.format(name=base_name))
 
-        print("Starting conversion thread...")
-        self.conversion_thread.start()
+    @Slot(str, str)
+    def handle_conversion_chunk(self, content, file_path):
+        """Streams one converted document into the pane as it arrives.
 
+        Only for single-file conversions: batches finish in pool order and are
+        assembled with per-file headers by the finalizer instead.
+        """
+        if not self.is_processing or len(self._batch_order) != 1:
+            return
+        self._streamed_to_output = True
+        if self.markdown_output.document().isEmpty():
+            self.markdown_output.setPlainText(content)
+        else:
+            self.markdown_output.appendPlainText("\n" + content)
 
     @Slot()
     def cancel_conversion(self):
         """Slot called when the progress dialog's Cancel button is clicked."""
-        print("Cancel button clicked.")
-        # Check if worker exists and we are actually processing
-        if self.conversion_worker and self.is_processing:
-            print("Signalling worker thread to stop...")
-            self.conversion_worker.stop() # Tell the worker to stop
+        logger.debug("Cancel button clicked.")
+        # Check if workers exist and we are actually processing
+        if self.active_workers and self.is_processing:
+            logger.debug("Signalling worker threads to stop...")
+            for worker in self.active_workers.values():
+                worker.stop() # Queued workers bail out on their first check
             if self.progress_dialog:
                 # Update dialog to show cancellation is in progress
                 self.progress_dialog.setLabelText("Cancelling conversion, please wait...")
                 self.progress_dialog.setEnabled(False) # Disable cancel button now
         else:
-            print("Cancel clicked but no active worker or not processing.")
-            # If cancel is clicked but processing already finished somehow,
-            # handle_conversion_finished should still clean up the dialog.
+            logger.debug("Cancel clicked but no active workers or not processing.")
 
 
-    @Slot(list, str)
-    def handle_conversion_complete(self, docs, original_file_path):
-        """Handles successful completion signal from the worker thread."""
-        print(f"Handling conversion complete signal for: {original_file_path}")
+    @Slot(object, str)
+    def handle_conversion_complete(self, markdown, original_file_path):
+        """Handles a successful completion signal from a worker."""
+        logger.debug("Handling conversion complete signal for: %s", original_file_path)
 
         # --- State Check ---
-        # Ensure this signal corresponds to the currently processed file and state
-        if original_file_path != self.last_processed_file or not self.is_processing:
-            print("Warning: Received completion signal for outdated/unexpected file or state. Ignoring.")
-            # Even if ignored, handle_conversion_finished will still run via thread.finished
-            # Explicitly quit the thread here just in case.
-            if self.conversion_thread:
-                print("Quitting thread due to outdated completion signal.")
-                self.conversion_thread.quit()
+        # Ensure this signal corresponds to a file of the current batch
+        if original_file_path not in self.active_workers or not self.is_processing:
+            logger.warning("Received completion signal for outdated/unexpected file or state. Ignoring.")
             return
 
         # --- Process Results ---
+        # The worker already assembled the markdown: a non-empty string is the
+        # result, "" means documents without content, None means no documents.
         base_name = os.path.basename(original_file_path)
-        if docs:
-            # Extract page content, filtering out potential None values
-            page_contents = [doc.page_content for doc in docs if hasattr(doc, 'page_content') and doc.page_content]
-            if page_contents:
-                full_markdown = "\n\n".join(page_contents)
-                self.markdown_output.setText(full_markdown)
-                self.set_status(f"✅ Successfully converted '{base_name}'!", is_success=True)
-            else:
-                # Handle case where docs exist but have no content
-                self.markdown_output.setPlaceholderText(f"Conversion of '{base_name}' resulted in empty content.")
-                self.show_error(f"Conversion resulted in empty content for '{base_name}'.")
-                self.reset_status("Conversion failed: Empty result.")
+        if markdown:
+            self._batch_results[original_file_path] = markdown
+            self.set_status(f"✅ Successfully converted '{base_name}'!", is_success=True)
+        elif markdown is not None:
+            # Handle case where docs exist but have no content
+            self.show_error(f"Conversion resulted in empty content for '{base_name}'.")
+            self.reset_status("Conversion failed: Empty result.")
         else:
             # Handle case where the loader returned an empty list or None
-            self.markdown_output.setPlaceholderText(f"No processable documents found in '{base_name}'.")
             self.show_error(f"Docling returned no processable documents for '{base_name}'.")
             self.reset_status("Conversion failed: No documents.")
 
-        # --- Explicitly tell the thread to quit ---
-        # This encourages the finished signal to be emitted.
-        if self.conversion_thread:
-            print("Explicitly quitting conversion thread after handling completion.")
-            self.conversion_thread.quit()
-        # --- IMPORTANT ---
-        # UI re-enabling and final cleanup STILL happens in handle_conversion_finished
-        # which is triggered by the thread's finished() signal.
+        self._file_finished(original_file_path)
 
 
     @Slot(str, str, str)
     def handle_conversion_error(self, error_type, error_message_str, original_file_path):
         """Handles error signal from the worker thread."""
-        print(f"Handling conversion error signal ({error_type}) for: {original_file_path}")
+        logger.debug("Handling conversion error signal (%s) for: %s", error_type, original_file_path)
 
         # --- State Check ---
-        if original_file_path != self.last_processed_file or not self.is_processing:
-             print("Warning: Received error signal for outdated/unexpected file or state. Ignoring.")
-             # Explicitly quit the thread here just in case.
-             if self.conversion_thread:
-                 print("Quitting thread due to outdated error signal.")
-                 self.conversion_thread.quit()
+        if original_file_path not in self.active_workers or not self.is_processing:
+             logger.warning("Received error signal for outdated/unexpected file or state. Ignoring.")
              return
 
         # --- Process Error ---
         base_name = os.path.basename(original_file_path)
-        self.markdown_output.clear() # Clear any partial output or placeholder
-
-        # Construct user-friendly messages based on error type
-        user_msg = f"Failed to convert '{base_name}'."
-        status_msg = f"❌ Conversion failed ({error_type})." # Default status
 
+        # Construct user-friendly messages based on error type. Each branch
+        # builds its message in one piece instead of incremental `+=` growth.
         if error_type == "Cancelled":
             user_msg = f"Conversion for '{base_name}' was cancelled."
             status_msg = "🤷‍♀️ Conversion Cancelled."
             self.markdown_output.setPlaceholderText("Conversion was cancelled.")
         elif error_type == "OSError":
             # Specific check for Windows privilege error (common with symlinks/cache)
-            if platform.system() == 'Windows' and "1314" in error_message_str:
-                 user_msg += (f"\n\nPrivilege Error (WinError 1314).\n\n"
-                              f"Troubleshooting:\n- Try running as Administrator.\n"
-                              f"- Check permissions for Hugging Face cache:\n"
-                              f"  C:\\Users\\{os.getlogin()}\\.cache\\huggingface")
+            if IS_WINDOWS and "1314" in error_message_str:
+                 user_msg = (f"Failed to convert '{base_name}'."
+                             f"\n\nPrivilege Error (WinError 1314).\n\n"
+                             f"Troubleshooting:\n- Try running as Administrator.\n"
+                             f"- Check permissions for Hugging Face cache:\n"
+                             f"  C:\\Users\\{_user_login()}\\.cache\\huggingface")
             else:
-                 user_msg += f"\n\nOS Error: {error_message_str}\n\nCheck file permissions and if the file is open elsewhere."
+                 user_msg = (f"Failed to convert '{base_name}'."
+                             f"\n\nOS Error: {error_message_str}\n\nCheck file permissions and if the file is open elsewhere.")
             status_msg = "❌ Conversion failed (OS Error)."
             self.markdown_output.setPlaceholderText("Conversion failed (OS Error). See message.")
         elif error_type == "ImportError":
-            user_msg += f" A required dependency might be missing.\n\nDetails: {error_message_str}"
+            user_msg = f"Failed to convert '{base_name}'. A required dependency might be missing.\n\nDetails: {error_message_str}"
             status_msg = "❌ Conversion failed (Missing Dependency)."
             self.markdown_output.setPlaceholderText("Conversion failed (Missing Dependency). See message.")
         else: # General Exception
-            user_msg += f"\n\nUnexpected Error: {error_type}\n\nDetails: {error_message_str}\n\nSee console for detailed traceback."
+            user_msg = (f"Failed to convert '{base_name}'."
+                        f"\n\nUnexpected Error: {error_type}\n\nDetails: {error_message_str}\n\nSee console for detailed traceback.")
+            status_msg = f"❌ Conversion failed ({error_type})."
             self.markdown_output.setPlaceholderText(f"Conversion failed ({error_type}). See message.")
 
-        # Show error message box only if it wasn't a user cancellation
-        if error_type != "Cancelled":
-            self.show_error(user_msg) # show_error uses QTimer.singleShot for safety
-
-        # Update the status bar (reset_status uses QTimer.singleShot)
-        self.reset_status(status_msg)
+        # Deliver the status update and (unless cancelled) the error popup in
+        # ONE deferred UI update instead of queueing a separate zero-timer for
+        # each, halving the event-loop round-trips on the error path.
+        show_popup = error_type != "Cancelled"
+        self.original_status_text = status_msg
+
+        def deliver_error_ui():
+            self.set_status(status_msg)
+            if show_popup:
+                if not self._ui_blocked:
+                    QMessageBox.warning(self, "Error", user_msg)
+                else:
+                    logger.warning("Suppressed Error Popup (Window/UI Disabled): %s", user_msg)
 
-        # --- Explicitly tell the thread to quit ---
-        # This encourages the finished signal to be emitted.
-        if self.conversion_thread:
-            print("Explicitly quitting conversion thread after handling error.")
-            self.conversion_thread.quit()
-        # --- IMPORTANT ---
-        # UI re-enabling and final cleanup STILL happens in handle_conversion_finished
+        QTimer.singleShot(0, deliver_error_ui)
 
+        self._file_finished(original_file_path)
 
-    @Slot()
-    def handle_conversion_finished(self):
-        """Central cleanup called when the conversion thread finishes (success, error, or cancel)."""
-        # This slot is connected to the thread's finished() signal.
-        print(">>> handle_conversion_finished STARTING <<<") # Diagnostic print
 
-        # --- Close and clean up progress dialog FIRST ---
-        print("Checking progress dialog...")
+    def _file_finished(self, file_path):
+        """Marks one batch file as done; finalizes the batch after the last."""
+        worker = self.active_workers.pop(file_path, None)
+        if worker is not None:
+            # Break the signal->slot links explicitly: connections otherwise
+            # keep the worker's signal holder (and whatever it references)
+            # alive until the receiving QObject is destroyed.
+            try:
+                worker.signals.conversion_complete.disconnect(self.handle_conversion_complete)
+                worker.signals.conversion_error.disconnect(self.handle_conversion_error)
+                worker.signals.progress_update.disconnect(self.handle_progress_update)
+                worker.signals.conversion_chunk.disconnect(self.handle_conversion_chunk)
+            except (RuntimeError, TypeError):
+                pass # Already disconnected/destroyed; nothing to release
+        self._batch_done += 1
+        total = len(self._batch_order)
+        if total > 1:
+            # Update just this file's row in the batch list
+            try:
+                row = self._batch_order.index(file_path)
+            except ValueError:
+                row = -1
+            if row >= 0:
+                mark = "✅" if file_path in self._batch_results else "❌"
+                self.batch_list_model.setData(
+                    self.batch_list_model.index(row),
+                    f"{mark} {os.path.basename(file_path)}"
+                )
+        dialog = self.progress_dialog
+        if dialog and total > 1:
+            # Label first: setValue() on a modal QProgressDialog internally
+            # runs processEvents(), which can deliver the batch's remaining
+            # queued completion signals re-entrantly — nested _file_finished
+            # calls may finalize the whole batch (and null the dialog
+            # reference) before setValue() returns.
+            dialog.setLabelText(f"Converted {self._batch_done} of {total} files...")
+            dialog.setValue(self._batch_done)
+            if self.progress_dialog is None:
+                # A nested delivery finalized the batch during setValue()
+                return
+        if self._batch_done >= total:
+            self._finalize_batch()
+
+    def _finalize_batch(self):
+        """Central cleanup once every file of the batch has completed."""
+        # Re-entrancy guard: nested signal deliveries from the progress
+        # dialog's implicit processEvents() can reach here first; the
+        # unwinding outer frames must not finalize the same batch again.
+        if self._batch_finalized:
+            logger.debug("Batch already finalized; skipping duplicate call.")
+            return
+        self._batch_finalized = True
+        self._finalize_batch_impl()
+
+    def _finalize_batch_impl(self):
+        """Does the actual batch cleanup (guarded by _finalize_batch)."""
+        logger.debug(">>> _finalize_batch STARTING <<<")
+
+        # --- Assemble the combined output in submission order ---
+        parts = []
+        for path in self._batch_order:
+            markdown = self._batch_results.get(path)
+            if markdown:
+                if len(self._batch_order) > 1:
+                    parts.append(f"<!-- {os.path.basename(path)} -->\n\n{markdown}")
+                else:
+                    parts.append(markdown)
+        if parts:
+            self._current_markdown = "\n\n---\n\n".join(parts)
+            # A streamed single-file conversion usually already shows exactly
+            # this text; skip the second full document load in that case.
+            if (self._streamed_to_output
+                    and self.markdown_output.toPlainText() == self._current_markdown):
+                logger.debug("Streamed output already current; skipping re-set.")
+            else:
+                # Suppress repaints while the (possibly huge) document is set;
+                # one repaint at the end instead of paint events mid-layout.
+                self.markdown_output.setUpdatesEnabled(False)
+                try:
+                    self.markdown_output.setPlainText(self._current_markdown)
+                finally:
+                    self.markdown_output.setUpdatesEnabled(True)
+        elif self._streamed_to_output:
+            # Nothing usable came back (cancelled/failed mid-stream): drop the
+            # partially streamed pages so the pane matches the empty cached
+            # markdown instead of showing text Copy/Save would deny knowing.
+            self.markdown_output.clear()
+
+        # Worker objects are plain QObjects owned by Python; dropping the
+        # references is all the cleanup they need (pool threads are reused).
+        self.active_workers.clear()
+
+        # --- Close the progress dialog, then finalize the UI ---
+        # The deferred hop only exists to let the event loop process the
+        # dialog close first; without a dialog, finalize synchronously.
+        logger.debug("Checking progress dialog...")
         if self.progress_dialog:
-            print("Closing progress dialog...")
+            logger.debug("Closing progress dialog...")
             # It's important to close it before potentially blocking operations
             self.progress_dialog.close()
-            # Schedule for deletion if it makes sense, but setting to None is key
-            # self.progress_dialog.deleteLater() # Usually not needed if closed
             self.progress_dialog = None # Crucial: Release reference immediately
-            print("Progress dialog closed and reference cleared.")
+            QTimer.singleShot(0, self._finalize_conversion_ui)
+            logger.debug(">>> _finalize_batch COMPLETED (UI update deferred) <<<")
         else:
-            print("Progress dialog reference was already None.")
-
-        # --- Defer rest of UI updates slightly using QTimer ---
-        # This allows the event loop to process the dialog closing first.
-        QTimer.singleShot(0, self._finalize_conversion_ui)
-
-        # --- Clean up thread and worker objects ---
-        # This can happen immediately after signaling the UI update timer.
-        # The objects will be deleted when control returns to the event loop.
-        print("Scheduling thread and worker deletion...")
-        if self.conversion_worker:
-            self.conversion_worker.deleteLater()
-            self.conversion_worker = None
-        if self.conversion_thread:
-            # Thread should already be quit by handle_complete/error,
-            # but quit() here is safe. deleteLater schedules deletion.
-            self.conversion_thread.quit()
-            self.conversion_thread.deleteLater()
-            self.conversion_thread = None
-        print("Thread and worker scheduled for deletion.")
-
-        print(">>> handle_conversion_finished COMPLETED (UI update deferred) <<<")
+            logger.debug("Progress dialog reference was already None.")
+            self._finalize_conversion_ui()
+            logger.debug(">>> _finalize_batch COMPLETED <<<")
 
     @Slot()
     def _finalize_conversion_ui(self):
         """Helper slot called by QTimer to finalize UI updates after conversion."""
-        print(">>> _finalize_conversion_ui STARTING <<<")
+        logger.debug(">>> _finalize_conversion_ui STARTING <<<")
 
         # --- Reset processing flag ---
         # Needs to happen before enabling UI/buttons that depend on it
-        print(f"Setting is_processing from {self.is_processing} to False")
+        logger.debug("Setting is_processing from %s to False", self.is_processing)
         self.is_processing = False
 
         # --- Re-enable main UI elements ---
-        print("Calling set_ui_enabled(True)...")
+        logger.debug("Calling set_ui_enabled(True)...")
         self.set_ui_enabled(True)
-        print("set_ui_enabled(True) called.")
+        logger.debug("set_ui_enabled(True) called.")
 
         # --- Reset placeholder text if output is still empty ---
-        # This might happen on error or if conversion yielded nothing
-        if not self.markdown_output.toPlainText().strip():
+        # This might happen on error or if conversion yielded nothing.
+        # document().isEmpty() is O(1); no full-text extraction needed.
+        if self.markdown_output.document().isEmpty():
             self.markdown_output.setPlaceholderText("Converted Markdown will appear here...")
-            print("Placeholder text reset (if needed).")
+            logger.debug("Placeholder text reset (if needed).")
 
         # --- Update button states ---
         # Relies on is_processing being False now
-        print("Calling update_action_buttons_state()...")
+        logger.debug("Calling update_action_buttons_state()...")
         self.update_action_buttons_state()
-        print("update_action_buttons_state() called.")
+        logger.debug("update_action_buttons_state() called.")
 
         # --- Check and reset status if needed ---
-        # If the status still shows a processing state, reset it to the default ready state.
-        current_status = self.status_label.text()
-        if current_status.startswith("⏳") or "Preparing" in current_status or "Initializing" in current_status or "Converting" in current_status:
-            print(f"Resetting status label from '{current_status}' as it shows processing state.")
+        # set_status tracks whether the message on display is a processing
+        # one; no substring sniffing of the label text required.
+        if self._status_is_processing:
+            logger.debug("Resetting status label as it still shows a processing state.")
             # Use reset_status which handles setting the correct baseline text
             self.reset_status()
         else:
-             print(f"Status label ('{current_status}') doesn't show processing, not resetting.")
+             logger.debug("Status label doesn't show processing, not resetting.")
 
-        print(">>> _finalize_conversion_ui COMPLETED <<<")
+        logger.debug(">>> _finalize_conversion_ui COMPLETED <<<")
 
 
     # --- Action Button Slots (Copy, Save) ---
     @Slot()
     def copy_markdown_to_clipboard(self):
         """Copies the content of the markdown output to the clipboard."""
-        markdown_text = self.markdown_output.toPlainText()
+        # The output pane is read-only, so the cached string is authoritative
+        # and we avoid re-extracting the whole document from the widget.
+        markdown_text = self._current_markdown
         if markdown_text:
-            try:
-                QApplication.clipboard().setText(markdown_text)
-                self.set_status("📋 Markdown copied to clipboard!", is_success=True, temporary=True)
-            except Exception as e:
-                # Handle potential clipboard errors (rare)
-                self.show_error(f"Could not copy to clipboard: {e}")
-                self.set_status("❌ Clipboard copy failed.", temporary=True)
+            # QClipboard.setText reports failures by emitting nothing — it
+            # does not raise — so the old try/except was dead weight on a
+            # Python-level hot path. The explicit mode makes clear this is
+            # the real clipboard, not the X11 selection.
+            QGuiApplication.clipboard().setText(markdown_text, QClipboard.Mode.Clipboard)
+            self.set_status("📋 Markdown copied to clipboard!", is_success=True, temporary=True)
         else:
             # No text to copy
             self.set_status("🤷‍♀️ Nothing to copy.", temporary=True)
@@ -901,86 +1426,137 @@ class MarkdownConverterApp(QMainWindow):
     @Slot()
     def save_markdown_to_file(self):
         """Opens a save file dialog to save the markdown content."""
-        markdown_text = self.markdown_output.toPlainText()
+        # The pane is read-only, so the cached string from the conversion is
+        # authoritative — no full-document extraction per save.
+        markdown_text = self._current_markdown
         if not markdown_text:
             self.set_status("🤷‍♀️ Nothing to save.", temporary=True)
             return
 
-        # Suggest a filename based on the last processed file
-        default_filename = "output.md"
-        if self.last_processed_file:
-            base = os.path.basename(self.last_processed_file)
-            name_without_ext = os.path.splitext(base)[0]
-            default_filename = f"{name_without_ext}.md"
-
-        # File type filters for the save dialog
-        save_filters = "Markdown Files (*.md);;Text Files (*.txt);;All Files (*)"
-
-        file_path, selected_filter = QFileDialog.getSaveFileName(
-            self,
-            "Save Markdown As",
-            default_filename, # Suggested filename/path
-            save_filters
+        # Suggest the filename cached when the conversion started
+        default_filename = self._suggested_save_name
+
+        # Suggest the last-used directory alongside the filename
+        if self._last_dialog_dir:
+            default_filename = os.path.join(self._last_dialog_dir, default_filename)
+
+        # Non-native dialog shown asynchronously with open(): the event loop
+        # keeps running (status updates, repaints) instead of blocking inside
+        # a nested exec until the user picks a path.
+        dialog = QFileDialog(self, "Save Markdown As", default_filename)
+        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+        dialog.setFileMode(QFileDialog.FileMode.AnyFile)
+        dialog.setNameFilter(self.SAVE_FILE_FILTERS)
+        dialog.setOption(QFileDialog.Option.DontUseNativeDialog, True)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.fileSelected.connect(
+            lambda path, dialog=dialog: self._write_markdown_file(
+                path, dialog.selectedNameFilter(), markdown_text
+            )
         )
+        dialog.open()
 
-        if file_path: # Proceed if a path was chosen
-            # Automatically add extension if missing based on filter (optional but helpful)
-            try:
-                # Check lower case extension to be safe
-                file_lower = file_path.lower()
-                if selected_filter == "Markdown Files (*.md)" and not file_lower.endswith((".md", ".markdown")):
-                    file_path += ".md"
-                elif selected_filter == "Text Files (*.txt)" and not file_lower.endswith(".txt"):
-                    file_path += ".txt"
-                # Basic check if *any* extension is missing when "All Files" might be used
-                elif '.' not in os.path.basename(file_path):
-                     file_path += ".md" # Default to .md if none provided
-
-                # Write the file using UTF-8 encoding
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(markdown_text)
-
-                saved_filename = os.path.basename(file_path)
-                self.set_status(f"💾 Saved to '{saved_filename}'", is_success=True, temporary=True)
+    def _write_markdown_file(self, file_path, selected_filter, markdown_text):
+        """Submits the markdown write to the pool once the dialog accepts."""
+        if not file_path:
+            return
+        self._last_dialog_dir = os.path.dirname(file_path)
+        # Automatically add extension if missing based on filter (optional but helpful)
+        # Check lower case extension to be safe
+        file_lower = file_path.lower()
+        if selected_filter == "Markdown Files (*.md)" and not file_lower.endswith((".md", ".markdown")):
+            file_path += ".md"
+        elif selected_filter == "Text Files (*.txt)" and not file_lower.endswith(".txt"):
+            file_path += ".txt"
+        # Basic check if *any* extension is missing when "All Files" might be used
+        elif not PurePath(file_path).suffix:
+             file_path += ".md" # Default to .md if none provided
+
+        # The write itself runs on the global pool: a slow disk or network
+        # share no longer stalls the GUI thread.
+        worker = SaveWorker(file_path, markdown_text)
+        worker.signals.save_complete.connect(self._handle_save_complete)
+        worker.signals.save_error.connect(self._handle_save_error)
+        self._save_workers.add(worker)
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(str)
+    def _handle_save_complete(self, file_path):
+        """Reports a finished background save."""
+        self._release_save_worker()
+        saved_filename = os.path.basename(file_path)
+        self.set_status(f"💾 Saved to '{saved_filename}'", is_success=True, temporary=True)
 
-            except OSError as e:
-                # Handle file system errors (permissions, disk full, etc.)
-                self.show_error(f"Could not save file: {e}\n\nCheck directory permissions and available disk space.")
-                self.set_status("❌ File save failed (OS Error).", temporary=True)
-            except Exception as e:
-                # Handle other unexpected errors during save
-                tb_str = traceback.format_exc()
-                print(f"Save Error: {e}\n{tb_str}")
-                self.show_error(f"Could not save file: {type(e).__name__}: {e}")
-                self.set_status("❌ File save failed.", temporary=True)
+    @Slot(str, str)
+    def _handle_save_error(self, error_type, error_message):
+        """Reports a failed background save."""
+        self._release_save_worker()
+        if error_type == "OSError":
+            # File system errors (permissions, disk full, etc.)
+            self.show_error(f"Could not save file: {error_message}\n\nCheck directory permissions and available disk space.")
+            self.set_status("❌ File save failed (OS Error).", temporary=True)
+        else:
+            self.show_error(f"Could not save file: {error_type}: {error_message}")
+            self.set_status("❌ File save failed.", temporary=True)
+
+    def _release_save_worker(self):
+        """Drops references to save workers that have reported back."""
+        sender = self.sender()
+        for worker in list(self._save_workers):
+            if worker.signals is sender:
+                self._save_workers.discard(worker)
+                break
 
 
     # --- UI State Management ---
     @Slot()
     def update_action_buttons_state(self):
+        """Schedules a (coalesced) refresh of the Copy/Save button states.
+
+        Streaming conversions fire textChanged once per appended page; the
+        zero-interval single-shot timer folds any burst of requests within one
+        event-loop turn into a single refresh.
+        """
+        if not self._buttons_update_timer.isActive():
+            self._buttons_update_timer.start()
+
+    @Slot()
+    def _apply_action_buttons_state(self):
         """Enables/disables Copy and Save buttons based on text content and processing state."""
-        has_text = bool(self.markdown_output.toPlainText().strip())
-        # Buttons should be enabled only if there's text AND not currently processing AND initialized
-        can_interact = has_text and not self.is_processing and self.DoclingLoaderClass is not None
+        # document().isEmpty() is a constant-time property of the document,
+        # unlike extracting and stripping the full text on every signal.
+        has_text = not self.markdown_output.document().isEmpty()
+        # Buttons should be enabled only if there's text AND not currently
+        # processing AND initialized (is_ready flips exactly once, so the
+        # per-update class-attribute poll goes away)
+        can_interact = has_text and not self.is_processing and self.is_ready
 
         self.copy_button.setEnabled(can_interact)
         self.save_button.setEnabled(can_interact)
-        # print(f"Action buttons updated: Enabled={can_interact} (HasText={has_text}, NotProcessing={not self.is_processing}, Initialized={self.DoclingLoaderClass is not None})")
 
 
+    def _set_drop_hover(self, hovering: bool):
+        """Toggles the drop label's drag-hover styling via its QSS property."""
+        if self.drop_label.property("dragHover") == hovering:
+            return # Already polished for this state
+        self.drop_label.setProperty("dragHover", hovering)
+        label_style = self.drop_label.style()
+        label_style.unpolish(self.drop_label)
+        label_style.polish(self.drop_label)
+
     def set_ui_enabled(self, enabled: bool):
         """Enables or disables primary interaction widgets."""
         self.open_button.setEnabled(enabled)
+        # setEnabled flips the :disabled pseudo-state itself; Qt restyles the
+        # widget without any property write or manual unpolish/polish pass.
         self.drop_label.setEnabled(enabled)
-        # Also update the visual state of the drop label via property for styling
-        self.drop_label.setProperty("enabled", enabled)
-        # Re-polish the style to apply :disabled state changes
-        self.drop_label.style().unpolish(self.drop_label)
-        self.drop_label.style().polish(self.drop_label)
         # The markdown output and copy/save buttons are handled by update_action_buttons_state
 
     def set_status(self, message: str, is_success=False, is_processing=False, temporary=False):
         """Updates the status bar label with appropriate styling."""
+        # Remember whether a processing message is on display, so later code
+        # can ask without pattern-matching the label text
+        self._status_is_processing = is_processing
         # Update the baseline status text only if the new message is a non-temporary, non-processing final state
         if not is_processing and not temporary:
              # Consider success, ready, cancelled, or failed messages as potential baseline states
@@ -988,27 +1564,43 @@ class MarkdownConverterApp(QMainWindow):
              if is_final_state:
                  self.original_status_text = message # Store this as the text to return to
 
-        # Set the text
-        self.status_label.setText(message)
+        # Set the text (skip the repaint when nothing actually changed;
+        # rapid reset_status chains often re-submit the same message)
+        if self.status_label.text() != message:
+            self.status_label.setText(message)
 
-        # Set the style based on the type of message
-        base_style = "color: #999; padding-top: 5px; font-size: 9pt;" # Default grey
-        style = base_style
+        # Pick the color via the statusRole dynamic property; the actual rules
+        # live once in the window stylesheet. Only repolish when the role
+        # really changes — no per-call stylesheet parsing.
         if is_success:
-            style = "color: #2ecc71; padding-top: 5px; font-size: 9pt;" # Green for success
+            role = "success"
         elif is_processing:
-            style = "color: #f39c12; padding-top: 5px; font-size: 9pt;" # Orange for processing
+            role = "processing"
         elif "failed" in message.lower() or "Error" in message or "❌" in message:
-            style = "color: #e74c3c; padding-top: 5px; font-size: 9pt;" # Red for error/failure
-
-        self.status_label.setStyleSheet(style)
-
-        # If temporary, set a timer to revert to the stored original status
+            role = "error"
+        else:
+            role = "" # Default grey
+        if self.status_label.property("statusRole") != role:
+            self.status_label.setProperty("statusRole", role)
+            label_style = self.status_label.style()
+            label_style.unpolish(self.status_label)
+            label_style.polish(self.status_label)
+
+        # If temporary, (re)arm the shared revert timer; a later permanent
+        # status cancels any pending revert.
         if temporary:
-            # Capture the current baseline status *before* the timer lambda is created
-            current_baseline = self.original_status_text
-            # Use a timer to reset after 3 seconds, but only if the status hasn't changed again
-            QTimer.singleShot(3000, lambda: self.reset_status(current_baseline) if self.status_label.text() == message else None)
+            self._status_revert_message = message
+            self._status_revert_baseline = self.original_status_text
+            self._status_revert_timer.start()
+        else:
+            self._status_revert_timer.stop()
+
+    @Slot()
+    def _revert_temporary_status(self):
+        """Reverts a temporary status message once the shared timer fires."""
+        # Only revert if the temporary message is still the one on display
+        if self.status_label.text() == self._status_revert_message:
+            self.reset_status(self._status_revert_baseline)
 
     def reset_status(self, base_message=None):
         """Resets the status label to the stored baseline or a provided message."""
@@ -1017,80 +1609,125 @@ class MarkdownConverterApp(QMainWindow):
             # Use the appropriate ready/initializing text based on current app state
             base_message = self.ready_status_text if self.DoclingLoaderClass else "Initializing..."
 
-        # Store the new baseline if one was provided explicitly
-        if base_message is not None:
-             self.original_status_text = base_message
-
-        # Use QTimer.singleShot(0, ...) to ensure the update happens in the event loop,
-        # preventing potential conflicts if called rapidly.
-        QTimer.singleShot(0, lambda: self.set_status(self.original_status_text))
+        # Store the new baseline and apply it directly: reset_status only runs
+        # on the GUI thread, and set_status already skips no-op repaints, so
+        # the old zero-timer hop bought nothing but latency and a closure.
+        self.original_status_text = base_message
+        self.set_status(base_message)
 
 
     def show_error(self, message: str):
-        """Shows a warning message box, safely using QTimer."""
-        # Check if the main window/widget is enabled before showing a potentially blocking dialog
-        if self.isEnabled() and self.central_widget.isEnabled():
-            # Use QTimer.singleShot to ensure the message box is shown from the main event loop
-            # This prevents issues if show_error is called from a non-GUI context unexpectedly
-            QTimer.singleShot(0, lambda: QMessageBox.warning(self, "Error", message))
+        """Shows a warning message box, safely via a queued signal."""
+        # The queued connection delivers from the event loop, so this stays
+        # safe to call from any context without a timer + closure per error.
+        self._error_requested.emit(message)
+
+    @Slot(str)
+    def _show_error_box(self, message: str):
+        """Displays (or suppresses) a queued error popup on the GUI thread."""
+        # The only path that disables the UI for good is initialization
+        # failure, which sets _ui_blocked; a flag read replaces the two
+        # widget-tree isEnabled() queries per popup.
+        if not self._ui_blocked:
+            QMessageBox.warning(self, "Error", message)
         else:
             # If the UI is disabled (e.g., during init failure), just print to console
-            print(f"Suppressed Error Popup (Window/UI Disabled): {message}")
+            logger.warning("Suppressed Error Popup (Window/UI Disabled): %s", message)
 
 
     # --- Window Close Event ---
     def closeEvent(self, event):
         """Handles the window close event."""
-        print("Close event triggered.")
+        logger.debug("Close event triggered.")
 
         # --- Attempt to gracefully stop threads ---
-        # Stop Initialization Thread if running
-        if self.init_thread and self.init_thread.isRunning():
-            print("Stopping initialization worker/thread...")
-            # Request the thread's event loop to exit
-            self.init_thread.quit()
-            # Optionally wait briefly for it to finish
-            # self.init_thread.wait(100)
-
-        # Stop Conversion Thread if running
-        if self.conversion_thread and self.conversion_thread.isRunning():
-            print("Stopping conversion worker/thread...")
-            # Signal the worker to stop its operation (best effort)
-            if self.conversion_worker:
-                self.conversion_worker.stop()
-            # Request the thread's event loop to exit
-            self.conversion_thread.quit()
-            # Optionally wait
-            # self.conversion_thread.wait(100)
+        # The initialization runnable (if still active) lives on the global
+        # QThreadPool, which winds down with the application.
+
+        # Stop any conversions still running or queued on the pool
+        if self.active_workers:
+            logger.debug("Stopping conversion workers...")
+            for worker in self.active_workers.values():
+                worker.stop() # Best effort; queued workers bail out immediately
+            # Give the pool a bounded moment to wind down: workers test the
+            # cancel token between stages, so this normally returns quickly,
+            # and a clean exit avoids leaking OS threads (and losing queued
+            # deferred deletions) mid-conversion.
+            if not self.conversion_pool.waitForDone(2000):
+                logger.warning("Conversion pool still busy at shutdown; exiting anyway.")
+
+        # Let in-flight background saves land so a just-clicked save is not
+        # truncated by process teardown (QSaveFile commits atomically, but
+        # only if the worker gets to finish).
+        if self._save_workers:
+            logger.debug("Waiting for background saves...")
+            if not QThreadPool.globalInstance().waitForDone(2000):
+                logger.warning("Background save still running at shutdown.")
 
         # --- Close Progress Dialog if open ---
         if self.progress_dialog:
-            print("Closing progress dialog on exit.")
+            logger.debug("Closing progress dialog on exit.")
             self.progress_dialog.close()
 
         # Accept the close event to allow the window to close
-        print("Accepting close event.")
+        logger.debug("Accepting close event.")
         event.accept()
 
 
-if __name__ == "__main__":
-    # Ensure QApplication is created first
-    app = QApplication(sys.argv)
+def _apply_dark_theme(app):
+    """Applies the qdarkstyle theme (optional dependency).
+
+    The rendered QSS is cached to disk after the first launch; warm launches
+    read it back and import only the compiled resource module (which
+    registers the theme's icons), skipping qdarkstyle's template/palette
+    machinery and its qtpy dependency entirely.
+    """
+    qss_cache_path = os.path.join(_conversion_cache_dir(), 'qdarkstyle.qss')
+    try:
+        with open(qss_cache_path, encoding='utf-8') as fh:
+            stylesheet = fh.read()
+        import qdarkstyle.dark.darkstyle_rc # noqa: F401 -- registers icon resources
+        app.setStyleSheet(stylesheet)
+        logger.debug("Applied cached qdarkstyle stylesheet.")
+        return
+    except (OSError, ImportError):
+        pass # Cold cache or layout change; fall through to the full load
 
-    # Apply dark theme (optional, requires qdarkstyle)
     try:
         # Specify the Qt API being used (PySide6)
+        import qdarkstyle
         stylesheet = qdarkstyle.load_stylesheet(qt_api='pyside6')
         app.setStyleSheet(stylesheet)
-        print("Applied qdarkstyle stylesheet.")
+        logger.debug("Applied qdarkstyle stylesheet.")
+        # Populate the cache for the next launch (best effort)
+        try:
+            os.makedirs(_conversion_cache_dir(), exist_ok=True)
+            tmp_path = qss_cache_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as fh:
+                fh.write(stylesheet)
+            os.replace(tmp_path, qss_cache_path)
+        except OSError as e:
+            logger.warning("Stylesheet cache write skipped: %s", e)
     except ImportError:
-         print("Warning: qdarkstyle not found. Install with: pip install qdarkstyle")
+         logger.warning("qdarkstyle not found. Install with: pip install qdarkstyle")
     except Exception as e:
-        print(f"Warning: Could not load/apply qdarkstyle: {e}")
+        logger.warning("Could not load/apply qdarkstyle: %s", e)
+
+
+if __name__ == "__main__":
+    # Console logging for the handlers that use logging.exception
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    # Ensure QApplication is created first
+    app = QApplication(sys.argv)
 
     # Create and show the main window
     window = MarkdownConverterApp()
     window.show()
 
+    # Apply the dark theme once the window is up: importing qdarkstyle and
+    # parsing its stylesheet is slow enough to delay first paint otherwise.
+    QTimer.singleShot(0, lambda: _apply_dark_theme(app))
+
     # Start the Qt event loop
     sys.exit(app.exec())